@@ -4,38 +4,53 @@ Configuration settings for the API.
 All settings can be configured via environment variables.
 """
 import os
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 
 
+def _env_int(name: str, default: int) -> int:
+    """Read an integer environment variable with a default."""
+    value = os.getenv(name)
+    return int(value) if value is not None else default
+
+
+@dataclass(frozen=True, slots=True)
 class Settings:
-    """API configuration settings."""
-    
+    """API configuration settings (read once, immutable)."""
+
     # File size limits (in bytes)
-    MAX_ZIP_SIZE: int = int(os.getenv("MAX_ZIP_SIZE", str(500 * 1024 * 1024)))  # 500MB default
-    MAX_PDF_SIZE: int = int(os.getenv("MAX_PDF_SIZE", str(100 * 1024 * 1024)))  # 100MB default
-    
+    MAX_ZIP_SIZE: int = field(default_factory=lambda: _env_int("MAX_ZIP_SIZE", 500 * 1024 * 1024))  # 500MB default
+    MAX_PDF_SIZE: int = field(default_factory=lambda: _env_int("MAX_PDF_SIZE", 100 * 1024 * 1024))  # 100MB default
+
     # Processing limits
-    MAX_PDFS: int = int(os.getenv("MAX_PDFS", "100"))  # Maximum PDFs per ZIP
-    PROCESSING_TIMEOUT: int = int(os.getenv("PROCESSING_TIMEOUT", "3600"))  # 1 hour default
-    
+    MAX_PDFS: int = field(default_factory=lambda: _env_int("MAX_PDFS", 100))  # Maximum PDFs per ZIP
+    PROCESSING_TIMEOUT: int = field(default_factory=lambda: _env_int("PROCESSING_TIMEOUT", 3600))  # 1 hour default
+
     # Temporary directory
-    TEMP_DIR: Path = Path(os.getenv("TEMP_DIR", os.path.join(os.path.sep, "tmp", "compressor-api")))
-    
+    TEMP_DIR: Path = field(default_factory=lambda: Path(
+        os.getenv("TEMP_DIR", os.path.join(os.path.sep, "tmp", "compressor-api"))
+    ))
+
     # Cleanup delay (seconds to wait before cleanup)
-    CLEANUP_DELAY: int = int(os.getenv("CLEANUP_DELAY", "60"))
-    
+    CLEANUP_DELAY: int = field(default_factory=lambda: _env_int("CLEANUP_DELAY", 60))
+
     # API settings
     API_TITLE: str = "Compressor to Excel API"
     API_VERSION: str = "1.0.0"
     API_DESCRIPTION: str = "API for processing ZIP files containing compressor PDFs and generating Excel output"
-    
-    @classmethod
-    def ensure_temp_dir(cls):
+
+    def ensure_temp_dir(self) -> Path:
         """Ensure temporary directory exists and create if needed."""
-        cls.TEMP_DIR.mkdir(parents=True, exist_ok=True)
-        return cls.TEMP_DIR
+        self.TEMP_DIR.mkdir(parents=True, exist_ok=True)
+        return self.TEMP_DIR
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the settings instance, reading the environment only once."""
+    return Settings()
 
+
+# Global settings instance
+settings = get_settings()
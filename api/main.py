@@ -4,11 +4,16 @@ FastAPI application for compressor-to-excel service.
 Provides REST API endpoints for uploading ZIP files containing PDFs
 and receiving Excel output with combined compressor data.
 """
+import asyncio
+import shutil
 import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from fastapi import FastAPI, UploadFile, File, HTTPException, status
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.background import BackgroundTask
+from starlette.concurrency import run_in_threadpool
 import sys
 import os
 
@@ -21,7 +26,6 @@ from api.utils import (
     extract_zip_file,
     find_pdf_files,
     cleanup_directory,
-    validate_file_size,
     sanitize_filename
 )
 from api.models import ErrorResponse, HealthResponse, ProcessingSummary
@@ -29,6 +33,61 @@ from api.models import ErrorResponse, HealthResponse, ProcessingSummary
 # Ensure temp directory exists
 settings.ensure_temp_dir()
 
+# Chunk size for streaming uploads to disk (1 MiB)
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+
+# Small shared pool for delayed temp-directory cleanup; bounded so cleanup
+# never competes with request handling for threads
+_CLEANUP_POOL = ThreadPoolExecutor(max_workers=2)
+
+# Process pool for the CPU-bound PDF parsing work; created on first use so
+# importing the module (e.g. for docs generation) doesn't fork workers
+_PROCESS_POOL = None
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """Return the shared process pool, creating it on first use."""
+    global _PROCESS_POOL
+    if _PROCESS_POOL is None:
+        _PROCESS_POOL = ProcessPoolExecutor(max_workers=max(1, (os.cpu_count() or 2) - 1))
+    return _PROCESS_POOL
+
+
+def _schedule_cleanup(directory: Path):
+    """Schedule directory cleanup after CLEANUP_DELAY on the event loop."""
+    asyncio.get_running_loop().call_later(
+        settings.CLEANUP_DELAY,
+        lambda: _CLEANUP_POOL.submit(cleanup_directory, directory)
+    )
+
+
+def _cleanup_response_files(excel_path: Path, extract_dir: Path):
+    """Remove the generated Excel file and extraction directory after the
+    response body has been fully sent."""
+    try:
+        excel_path.unlink(missing_ok=True)
+    except Exception:
+        pass
+    cleanup_directory(extract_dir)
+
+
+def _spool_to_disk(src, dest_path: Path) -> int:
+    """
+    Copy an already-spooled upload to disk without an intermediate buffer.
+
+    Args:
+        src: Seekable file-like object (Starlette's SpooledTemporaryFile)
+        dest_path: Destination file path
+
+    Returns:
+        int: Number of bytes written
+    """
+    src.seek(0)
+    with open(dest_path, 'wb', buffering=UPLOAD_CHUNK_SIZE) as dst:
+        shutil.copyfileobj(src, dst, length=UPLOAD_CHUNK_SIZE)
+        return dst.tell()
+
 # Create FastAPI app
 app = FastAPI(
     title=settings.API_TITLE,
@@ -36,7 +95,8 @@ app = FastAPI(
     description=settings.API_DESCRIPTION,
     docs_url="/api/docs",
     redoc_url="/api/redoc",
-    openapi_url="/api/openapi.json"
+    openapi_url="/api/openapi.json",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -55,23 +115,21 @@ async def root():
     Root endpoint providing API information.
     
     Returns:
-        JSONResponse: API information and available endpoints
+        dict: API information and available endpoints (serialized via orjson)
     """
-    return JSONResponse(
-        content={
-            "name": settings.API_TITLE,
-            "version": settings.API_VERSION,
-            "description": settings.API_DESCRIPTION,
-            "status": "running",
-            "endpoints": {
-                "health": "/api/health",
-                "upload": "/api/upload",
-                "docs": "/api/docs",
-                "redoc": "/api/redoc",
-                "openapi": "/api/openapi.json"
-            }
+    return {
+        "name": settings.API_TITLE,
+        "version": settings.API_VERSION,
+        "description": settings.API_DESCRIPTION,
+        "status": "running",
+        "endpoints": {
+            "health": "/api/health",
+            "upload": "/api/upload",
+            "docs": "/api/docs",
+            "redoc": "/api/redoc",
+            "openapi": "/api/openapi.json"
         }
-    )
+    }
 
 
 @app.get("/api/health", response_model=HealthResponse, tags=["Health"])
@@ -110,7 +168,8 @@ async def upload_zip_file(file: UploadFile = File(..., description="ZIP file con
     temp_zip_path = None
     extract_dir = None
     temp_excel_path = None
-    
+    cleanup_after_response = False
+
     try:
         # Validate file type
         if not file.filename or not file.filename.lower().endswith('.zip'):
@@ -119,29 +178,29 @@ async def upload_zip_file(file: UploadFile = File(..., description="ZIP file con
                 detail="File must be a ZIP file (.zip extension)"
             )
         
-        # Save uploaded file to temporary location
-        temp_zip_path = Path(tempfile.mktemp(suffix='.zip', dir=settings.TEMP_DIR))
-        
-        # Read file content and validate size
-        file_content = await file.read()
-        file_size = len(file_content)
-        
+        # Let zipfile read the already-spooled upload directly: the spooled
+        # file is seekable, so the ZIP bytes never need a second trip
+        # through disk; spill to a temp file only for non-seekable sources
+        if file.file.seekable():
+            zip_source = file.file
+            file_size = file.file.seek(0, os.SEEK_END)
+        else:
+            with tempfile.NamedTemporaryFile(suffix='.zip', dir=settings.TEMP_DIR, delete=False) as tmp:
+                temp_zip_path = Path(tmp.name)
+            file_size = await run_in_threadpool(_spool_to_disk, file.file, temp_zip_path)
+            zip_source = temp_zip_path
+
         if file_size > settings.MAX_ZIP_SIZE:
             raise HTTPException(
                 status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
                 detail=f"ZIP file size {file_size / (1024*1024):.2f} MB exceeds limit of {settings.MAX_ZIP_SIZE / (1024*1024):.2f} MB"
             )
-        
-        # Write to temporary file
-        with open(temp_zip_path, 'wb') as f:
-            f.write(file_content)
-        
-        # Validate ZIP file size
-        validate_file_size(temp_zip_path, settings.MAX_ZIP_SIZE)
-        
-        # Extract ZIP file
+
+        # Extract ZIP file on a worker thread: inflating a large archive
+        # takes seconds, and calling it inline would block the event loop
+        # (and every other request) for the whole extraction
         try:
-            extract_dir = extract_zip_file(temp_zip_path)
+            extract_dir = await run_in_threadpool(extract_zip_file, zip_source)
         except ValueError as e:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -162,22 +221,22 @@ async def upload_zip_file(file: UploadFile = File(..., description="ZIP file con
                 detail="No PDF files found in ZIP archive"
             )
         
-        # Validate individual PDF sizes
-        for pdf_file in pdf_files:
-            try:
-                validate_file_size(pdf_file, settings.MAX_PDF_SIZE)
-            except ValueError as e:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"PDF file {pdf_file.name} exceeds size limit: {str(e)}"
-                )
-        
-        # Create temporary Excel file
-        temp_excel_path = Path(tempfile.mktemp(suffix='.xlsx', dir=settings.TEMP_DIR))
+        # PDF sizes were already validated against the ZIP metadata during
+        # extraction, so no per-file stat() pass is needed here
+
+        # Create temporary Excel file; NamedTemporaryFile creates it with
+        # O_EXCL in one syscall instead of mktemp's exists()-probe loop,
+        # and the name cannot be raced by another process
+        with tempfile.NamedTemporaryFile(suffix='.xlsx', dir=settings.TEMP_DIR, delete=False) as tmp:
+            temp_excel_path = Path(tmp.name)
         
-        # Process PDFs using existing function
+        # Process PDFs in the shared process pool: the parsing work is
+        # CPU-bound and would otherwise hold this worker's GIL for the
+        # duration, blocking every other request
         try:
-            summary = process_multiple_pdfs(pdf_files, temp_excel_path)
+            summary = await asyncio.get_running_loop().run_in_executor(
+                _get_process_pool(), process_multiple_pdfs, pdf_files, temp_excel_path
+            )
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -189,14 +248,18 @@ async def upload_zip_file(file: UploadFile = File(..., description="ZIP file con
         if not output_filename.endswith('.xlsx'):
             output_filename = output_filename.rsplit('.', 1)[0] + '.xlsx'
         
-        # Return Excel file as download
+        # Return Excel file as download; the background task deletes the
+        # Excel file and extraction directory once the body is fully sent,
+        # so nothing is left on disk after a successful download
+        cleanup_after_response = True
         return FileResponse(
             path=str(temp_excel_path),
             filename=output_filename,
             media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
             headers={
                 "Content-Disposition": f'attachment; filename="{output_filename}"'
-            }
+            },
+            background=BackgroundTask(_cleanup_response_files, temp_excel_path, extract_dir)
         )
         
     except HTTPException:
@@ -218,15 +281,17 @@ async def upload_zip_file(file: UploadFile = File(..., description="ZIP file con
             except Exception:
                 pass
         
-        # Cleanup extraction directory after a delay to allow file operations to complete
-        if extract_dir and extract_dir.exists():
-            # Schedule cleanup in background (simplified - in production use proper task queue)
-            import threading
-            def delayed_cleanup():
-                import time
-                time.sleep(settings.CLEANUP_DELAY)
-                cleanup_directory(extract_dir)
-            threading.Thread(target=delayed_cleanup, daemon=True).start()
+        # On error paths the response background task never runs, so fall
+        # back to the delayed cleanup of the extraction directory and the
+        # partially written Excel file
+        if not cleanup_after_response:
+            if temp_excel_path and temp_excel_path.exists():
+                try:
+                    temp_excel_path.unlink()
+                except Exception:
+                    pass
+            if extract_dir and extract_dir.exists():
+                _schedule_cleanup(extract_dir)
 
 
 if __name__ == "__main__":
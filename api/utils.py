@@ -1,80 +1,152 @@
 """
 Utility functions for ZIP file handling and temporary file management.
 """
+import queue
+import re
 import zipfile
 import tempfile
+
+# Use ISA-L's SIMD-accelerated inflate for ZIP decompression when available
+# (2-4x faster than stock zlib on the same bytes); optional dependency,
+# stock zlib is used otherwise
+try:
+    from isal import isal_zlib
+    zipfile.zlib = isal_zlib
+    # zipfile binds crc32 at import time, so rebind it too: ISA-L's CRC32
+    # uses PCLMULQDQ folding (~8x faster than the table-driven loop), and
+    # zipfile checksums every byte it extracts
+    zipfile.crc32 = isal_zlib.crc32
+except ImportError:
+    isal_zlib = None
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional
 import os
 
 from api.config import settings
 
+# Chunk size for copying decompressed member data to disk (1 MiB)
+EXTRACT_CHUNK_SIZE = 1 << 20
+
+# Pool of reusable extraction buffers so concurrent workers don't allocate
+# a fresh chunk per member; buffers are returned to the pool after use
+_BUFFER_POOL: "queue.SimpleQueue[bytearray]" = queue.SimpleQueue()
 
-def extract_zip_file(zip_path: Path, extract_to: Optional[Path] = None) -> Path:
+
+def _get_buffer() -> bytearray:
+    """Get a reusable extraction buffer from the pool (allocate if empty)."""
+    try:
+        return _BUFFER_POOL.get_nowait()
+    except queue.Empty:
+        return bytearray(EXTRACT_CHUNK_SIZE)
+
+
+def _extract_member(zip_ref: zipfile.ZipFile, member: zipfile.ZipInfo, extract_to: Path):
     """
-    Extract ZIP file to a temporary directory.
-    
+    Extract a single ZIP member to the extraction directory.
+
+    Safe to call from multiple threads: each call opens its own handle on
+    the member, and zlib inflate plus file writes release the GIL.
+
+    Args:
+        zip_ref: Open ZipFile to read from
+        member: ZipInfo entry to extract
+        extract_to: Root extraction directory
+    """
+    target_path = extract_to / member.filename
+
+    if member.is_dir():
+        target_path.mkdir(parents=True, exist_ok=True)
+        return
+
+    target_path.parent.mkdir(parents=True, exist_ok=True)
+    buf = _get_buffer()
+    try:
+        with zip_ref.open(member) as src, open(target_path, 'wb') as dst:
+            while n := src.readinto(buf):
+                dst.write(memoryview(buf)[:n])
+    finally:
+        _BUFFER_POOL.put(buf)
+
+
+def extract_zip_file(zip_source, extract_to: Optional[Path] = None) -> Path:
+    """
+    Extract a ZIP file to a temporary directory.
+
     Args:
-        zip_path: Path to the ZIP file
+        zip_source: Path to the ZIP file, or a seekable binary file-like
+                    object (e.g. an upload already spooled by Starlette)
         extract_to: Optional directory to extract to (creates temp dir if not provided)
-    
+
     Returns:
         Path to the extraction directory
-    
+
     Raises:
         zipfile.BadZipFile: If file is not a valid ZIP
         ValueError: If ZIP is empty or contains no PDFs
     """
-    # Validate ZIP file
-    if not zip_path.exists():
-        raise FileNotFoundError(f"ZIP file not found: {zip_path}")
-    
-    if not zipfile.is_zipfile(zip_path):
-        raise zipfile.BadZipFile(f"File is not a valid ZIP: {zip_path}")
-    
+    # Validate ZIP source; ZipFile itself raises BadZipFile on invalid
+    # input, so no separate is_zipfile pre-read is needed
+    if isinstance(zip_source, (str, Path)):
+        zip_source = Path(zip_source)
+        if not zip_source.exists():
+            raise FileNotFoundError(f"ZIP file not found: {zip_source}")
+    else:
+        zip_source.seek(0)
+
     # Create extraction directory
     if extract_to is None:
         extract_to = Path(tempfile.mkdtemp(dir=settings.TEMP_DIR))
     else:
         extract_to.mkdir(parents=True, exist_ok=True)
-    
+
     # Extract ZIP file
     try:
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        with zipfile.ZipFile(zip_source, 'r') as zip_ref:
             # Validate ZIP contents
             file_list = zip_ref.namelist()
             if not file_list:
                 raise ValueError("ZIP file is empty")
             
             # Check for PDF files
-            pdf_files = [f for f in file_list if f.lower().endswith('.pdf')]
-            if not pdf_files:
+            pdf_members = [zi for zi in zip_ref.infolist() if zi.filename.lower().endswith('.pdf')]
+            if not pdf_members:
                 raise ValueError("ZIP file contains no PDF files")
-            
+
             # Check PDF count limit
-            if len(pdf_files) > settings.MAX_PDFS:
+            if len(pdf_members) > settings.MAX_PDFS:
                 raise ValueError(
-                    f"ZIP contains {len(pdf_files)} PDFs, exceeds limit of {settings.MAX_PDFS}"
+                    f"ZIP contains {len(pdf_members)} PDFs, exceeds limit of {settings.MAX_PDFS}"
                 )
+
+            # Check PDF sizes from the ZIP metadata already in hand: fails
+            # fast before any decompression and saves a stat() per PDF later
+            for zi in pdf_members:
+                if zi.file_size > settings.MAX_PDF_SIZE:
+                    raise ValueError(
+                        f"PDF file {zi.filename} size {zi.file_size / (1024*1024):.2f} MB "
+                        f"exceeds limit of {settings.MAX_PDF_SIZE / (1024*1024):.2f} MB"
+                    )
             
-            # Extract all files
-            zip_ref.extractall(extract_to)
-            
-            # Sanitize extracted paths (prevent zip slip attacks)
-            for member in zip_ref.namelist():
-                member_path = extract_to / member
-                # Check if path is within extract_to directory
-                try:
-                    member_path.resolve().relative_to(extract_to.resolve())
-                except ValueError:
-                    # Path is outside extract_to, remove it
-                    if member_path.exists():
-                        if member_path.is_file():
-                            member_path.unlink()
-                        elif member_path.is_dir():
-                            shutil.rmtree(member_path)
-            
+            # Validate member names before extraction (prevent zip slip
+            # attacks): a normalized-path prefix check on the name is enough
+            # and avoids resolve()/unlink work on already-extracted files
+            root = str(extract_to.resolve())
+            safe_members = [
+                member for member in zip_ref.infolist()
+                if os.path.normpath(os.path.join(root, member.filename)).startswith(root + os.sep)
+            ]
+
+            # Extract members concurrently: DEFLATE and the write syscalls
+            # both release the GIL, so a thread pool gives near-linear
+            # speedup on multi-core hosts for multi-PDF archives
+            with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+                list(executor.map(
+                    lambda member: _extract_member(zip_ref, member, extract_to),
+                    safe_members
+                ))
+
             return extract_to
             
     except zipfile.BadZipFile:
@@ -96,24 +168,41 @@ def find_pdf_files(directory: Path) -> List[Path]:
     Returns:
         List of Path objects for PDF files found
     """
-    pdf_files = []
-    
     if not directory.exists() or not directory.is_dir():
-        return pdf_files
-    
-    # Find PDF files (case-insensitive)
-    pdf_files = sorted(directory.glob("*.pdf")) + sorted(directory.glob("*.PDF"))
-    
-    # Remove duplicates
-    pdf_files = list(dict.fromkeys(pdf_files))
-    
+        return []
+
+    # Single directory pass; suffix check is case-insensitive so one scan
+    # covers both .pdf and .PDF without a dedup step
+    with os.scandir(directory) as it:
+        pdf_files = [
+            Path(entry.path) for entry in it
+            if entry.is_file(follow_symlinks=False) and entry.name.lower().endswith('.pdf')
+        ]
+
+    pdf_files.sort()
     return pdf_files
 
 
+def _fast_rmtree(path: str):
+    """
+    Remove a directory tree with scandir + unlink/rmdir directly.
+
+    Skips shutil.rmtree's per-entry stat() and error-callback machinery;
+    entry types come from the directory stream itself.
+    """
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                _fast_rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
+
+
 def cleanup_directory(directory: Path, delay: Optional[int] = None):
     """
     Clean up a temporary directory.
-    
+
     Args:
         directory: Directory to remove
         delay: Optional delay in seconds before cleanup
@@ -121,10 +210,10 @@ def cleanup_directory(directory: Path, delay: Optional[int] = None):
     if delay:
         import time
         time.sleep(delay)
-    
+
     if directory.exists() and directory.is_dir():
         try:
-            shutil.rmtree(directory)
+            _fast_rmtree(str(directory))
         except Exception:
             # Ignore cleanup errors
             pass
@@ -157,19 +246,21 @@ def validate_file_size(file_path: Path, max_size: int) -> bool:
     return True
 
 
+# Precompiled filter for sanitize_filename: everything outside the
+# word/./- allow-list is stripped in a single C-level pass
+_FILENAME_STRIP_RE = re.compile(r'[^\w.\-]')
+
+
 def sanitize_filename(filename: str) -> str:
     """
     Sanitize a filename to prevent path traversal attacks.
-    
+
     Args:
         filename: Original filename
-    
+
     Returns:
         Sanitized filename
     """
-    # Remove path separators and dangerous characters
-    sanitized = os.path.basename(filename)
-    # Remove any remaining dangerous characters
-    sanitized = "".join(c for c in sanitized if c.isalnum() or c in "._-")
-    return sanitized
+    # Remove path separators, then strip any remaining dangerous characters
+    return _FILENAME_STRIP_RE.sub('', os.path.basename(filename))
 